@@ -4,17 +4,33 @@
   const calcZone = document.getElementById('calcZone');
   const tbody = document.querySelector('#historyTable tbody');
   const printBtn = document.getElementById('printBtn');
+  const clientInput = document.getElementById('client');
+  const prestationInput = document.getElementById('prestation');
+  const datePrestInput = document.getElementById('datePrest');
+  const montantInput = document.getElementById('montant');
 
   const EURO = new Intl.NumberFormat('fr-FR', {style: 'currency', currency: 'EUR'});
 
   function format(n){ return EURO.format(Number(n||0)); }
   function today(){ return new Date().toISOString().slice(0,10); }
 
+  function buildRow(cells){
+    const tr = document.createElement('tr');
+    cells.forEach(text=>{
+      const td = document.createElement('td');
+      td.textContent = text;
+      tr.appendChild(td);
+    });
+    return tr;
+  }
+
   function compute(){
-    const montant = parseFloat(document.getElementById('montant').value || '0');
+    const montant = parseFloat(montantInput.value || '0');
     if(isNaN(montant)||montant<=0){ calcZone.classList.add('hidden'); return; }
-    const aici = Math.round(montant*0.5*100)/100;
-    const reste = Math.round((montant - aici)*100)/100;
+    const cents = Math.round(montant*100);
+    const aiciCents = Math.round(cents/2);
+    const aici = aiciCents/100;
+    const reste = (cents - aiciCents)/100;
     calcZone.innerHTML = `
       <div><strong>Total TTC :</strong> ${format(montant)}</div>
       <div><strong>Avance immédiate (50%) :</strong> ${format(aici)}</div>
@@ -29,15 +45,13 @@
 
   form.addEventListener('submit', (e)=>{
     e.preventDefault();
-    const c = document.getElementById('client').value.trim();
-    const p = document.getElementById('prestation').value.trim();
-    const d = document.getElementById('datePrest').value || today();
-    const m = parseFloat(document.getElementById('montant').value||'0');
+    const c = clientInput.value.trim();
+    const p = prestationInput.value.trim();
+    const d = datePrestInput.value || today();
+    const m = parseFloat(montantInput.value||'0');
     if(!c || !p || !m){ alert('Merci de compléter le formulaire.'); return; }
     const calc = compute();
-    const tr = document.createElement('tr');
-    tr.innerHTML = `<td>${d}</td><td>${c}</td><td>${p}</td><td>${format(m)}</td><td>${format(calc.aici)}</td><td>Transmis (démo)</td>`;
-    tbody.prepend(tr);
+    tbody.prepend(buildRow([d, c, p, format(m), format(calc.aici), 'Transmis (démo)']));
     form.reset();
     calcZone.classList.add('hidden');
     alert('Dossier transmis (démo). Aucun envoi réel à l’URSSAF n’est effectué.');
@@ -48,12 +62,11 @@
     {d:'2025-10-12', c:'Mme Dupont', p:'Entretien jardin', m:80},
     {d:'2025-10-05', c:'M. Martin', p:'Bricolage léger', m:120}
   ];
+  const frag = document.createDocumentFragment();
   seed.forEach(x=>{
-    const tr = document.createElement('tr');
-    const aici = x.m*0.5;
-    tr.innerHTML = `<td>${x.d}</td><td>${x.c}</td><td>${x.p}</td><td>${format(x.m)}</td><td>${format(aici)}</td><td>Réglé (démo)</td>`;
-    tbody.appendChild(tr);
+    frag.appendChild(buildRow([x.d, x.c, x.p, format(x.m), format(x.m*0.5), 'Réglé (démo)']));
   });
+  tbody.appendChild(frag);
 
   // Print to PDF (for evidence to URSSAF if needed)
   printBtn?.addEventListener('click', ()=> window.print());